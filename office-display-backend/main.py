@@ -4,126 +4,239 @@ Main entry point for the Flask application
 """
 import os
 import sys
+import time
 import logging
+from functools import lru_cache, partial
 from pathlib import Path
 
+_START = time.perf_counter()
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from flask import Flask, send_from_directory
 from flask_cors import CORS
-from src.models.user import db
-from src.routes.user import user_bp
-from src.routes.calendar import calendar_bp
-from src.routes.weather import weather_bp
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+from src.logging_config import configure_logging, init_request_logging
+from src.startup import LazyBlueprintDispatcher, profile
 
-# Initialize Flask app
-app = Flask(
-    __name__,
-    static_folder=os.path.join(os.path.dirname(__file__), 'static')
-)
+# Configure logging (queue-based, written off the request thread)
+configure_logging()
+logger = logging.getLogger(__name__)
 
-# Configuration
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'asdf#FGSgvasgf$5$WGT')
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['JSON_SORT_KEYS'] = False
+# Fast cold-start mode: serve health and index.html immediately and defer
+# blueprint (and Flask-SQLAlchemy / requests) imports until first use
+FAST_STARTUP = os.environ.get('FAST_STARTUP', 'false').lower() in ('1', 'true', 'yes')
+
+# In fast startup mode, build the remaining blueprints in the background once
+# the first request has been served (default: on)
+FAST_STARTUP_WARM = os.environ.get('FAST_STARTUP_WARM', 'true').lower() in ('1', 'true', 'yes')
+
+# Debug mode only applies to the built-in development server, not WSGI servers
+DEBUG = __name__ == '__main__' and os.environ.get('FLASK_ENV', 'development') == 'development'
+
+# API blueprints and the heavy modules each one pulls in. Dependencies are
+# imported one by one so the startup profile attributes time per module.
+BLUEPRINTS = [
+    {
+        'prefix': '/api/users',
+        'module': 'src.routes.user',
+        'name': 'user_bp',
+        'imports': ['flask_sqlalchemy', 'src.models.user'],
+        'database': True
+    },
+    {
+        'prefix': '/api/calendar',
+        'module': 'src.routes.calendar',
+        'name': 'calendar_bp',
+        'imports': [],
+        'database': False
+    },
+    {
+        'prefix': '/api/weather',
+        'module': 'src.routes.weather',
+        'name': 'weather_bp',
+        'imports': ['requests'],
+        'database': False
+    }
+]
+
+
+@lru_cache(maxsize=1)
+def read_index_html(index_path, mtime):
+    """
+    Read index.html and keep it in memory until the file changes
 
-# Enable CORS for all routes
-CORS(app, resources={r"/api/*": {"origins": "*"}})
+    Args:
+        index_path (str): Path to index.html
+        mtime (int): File modification time; a new value reloads the file
 
-# Initialize database
-db.init_app(app)
+    Returns:
+        bytes: File contents
+    """
+    with open(index_path, 'rb') as index_file:
+        return index_file.read()
 
-# Register blueprints
-app.register_blueprint(user_bp, url_prefix='/api')
-app.register_blueprint(calendar_bp, url_prefix='/api')
-app.register_blueprint(weather_bp, url_prefix='/api')
 
+def create_app(blueprints, cache_index=False, debug=False):
+    """
+    Create a Flask application serving the given blueprints
 
-@app.before_request
-def create_tables():
-    """Create database tables if they don't exist"""
-    db.create_all()
+    Every app also serves the health check, the startup profile and the
+    static frontend, so any of them can answer those routes.
 
+    Args:
+        blueprints (list): Entries from BLUEPRINTS to import and register
+        cache_index (bool): Serve index.html from memory instead of disk
+        debug (bool): Enable Flask debug mode
 
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve(path):
-    """
-    Serve static files and fallback to index.html for SPA routing
-    """
-    static_folder_path = app.static_folder
-    
-    if static_folder_path is None:
-        logger.error("Static folder not configured")
-        return "Static folder not configured", 404
-    
-    # Try to serve the requested file
-    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
-        return send_from_directory(static_folder_path, path)
-    
-    # Fallback to index.html for SPA routing
-    index_path = os.path.join(static_folder_path, 'index.html')
-    if os.path.exists(index_path):
-        return send_from_directory(static_folder_path, 'index.html')
-    
-    logger.warning(f"Requested path not found: {path}")
-    return "index.html not found", 404
-
-
-@app.errorhandler(404)
-def not_found(error):
-    """Handle 404 errors"""
-    logger.warning(f"404 error: {error}")
-    return {
-        'status': 'error',
-        'message': 'Resource not found'
-    }, 404
-
-
-@app.errorhandler(500)
-def internal_error(error):
-    """Handle 500 errors"""
-    logger.error(f"500 error: {error}")
-    return {
-        'status': 'error',
-        'message': 'Internal server error'
-    }, 500
-
-
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    """
-    Health check endpoint for monitoring
-    
     Returns:
-        JSON: Health status
+        Flask: Configured application
     """
-    return {
-        'status': 'healthy',
-        'message': 'Office Display Backend is running'
-    }, 200
+    app = Flask(
+        __name__,
+        static_folder=os.path.join(os.path.dirname(__file__), 'static')
+    )
+    app.debug = debug
+
+    # Configuration
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'asdf#FGSgvasgf$5$WGT')
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['JSON_SORT_KEYS'] = False
+
+    # Assign request ids and log request timings
+    init_request_logging(app)
+
+    # Enable CORS for all routes
+    CORS(app, resources={r"/api/*": {"origins": "*"}})
+
+    # Register blueprints, importing their dependencies on demand
+    for blueprint in blueprints:
+        for module_name in blueprint['imports']:
+            profile.import_module(module_name)
+        module = profile.import_module(blueprint['module'])
+        app.register_blueprint(getattr(module, blueprint['name']), url_prefix='/api')
+
+    # Initialize database
+    if any(blueprint['database'] for blueprint in blueprints):
+        from src.models.user import db
+        db.init_app(app)
+
+        @app.before_request
+        def create_tables():
+            """Create database tables if they don't exist"""
+            db.create_all()
+
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def serve(path):
+        """
+        Serve static files and fallback to index.html for SPA routing
+        """
+        static_folder_path = app.static_folder
+
+        if static_folder_path is None:
+            logger.error("Static folder not configured")
+            return "Static folder not configured", 404
+
+        # Try to serve the requested file
+        if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
+            return send_from_directory(static_folder_path, path)
+
+        # Fallback to index.html for SPA routing
+        index_path = os.path.join(static_folder_path, 'index.html')
+        if os.path.exists(index_path):
+            if cache_index:
+                index_html = read_index_html(index_path, os.stat(index_path).st_mtime_ns)
+                return app.response_class(index_html, mimetype='text/html')
+            return send_from_directory(static_folder_path, 'index.html')
+
+        logger.warning("Requested path not found: %s", path)
+        return "index.html not found", 404
+
+    @app.errorhandler(404)
+    def not_found(error):
+        """Handle 404 errors"""
+        logger.warning("404 error: %s", error)
+        return {
+            'status': 'error',
+            'message': 'Resource not found'
+        }, 404
+
+    @app.errorhandler(500)
+    def internal_error(error):
+        """Handle 500 errors"""
+        logger.error("500 error: %s", error)
+        return {
+            'status': 'error',
+            'message': 'Internal server error'
+        }, 500
+
+    @app.route('/api/health', methods=['GET'])
+    def health_check():
+        """
+        Health check endpoint for monitoring
+
+        Returns:
+            JSON: Health status
+        """
+        return {
+            'status': 'healthy',
+            'message': 'Office Display Backend is running'
+        }, 200
+
+    @app.route('/api/health/startup', methods=['GET'])
+    def startup_profile():
+        """
+        Startup profile report
+
+        Returns:
+            JSON: Time spent per startup phase and deferred module import
+        """
+        return {
+            'status': 'success',
+            'fast_startup': FAST_STARTUP,
+            'profile': profile.report()
+        }, 200
+
+    return app
+
+
+if FAST_STARTUP:
+    # The boot app stays a Flask instance (for the Flask CLI); API prefixes
+    # are dispatched to blueprint apps built on first use
+    app = create_app([], cache_index=True, debug=DEBUG)
+    app.wsgi_app = LazyBlueprintDispatcher(
+        app.wsgi_app,
+        {
+            blueprint['prefix']: partial(create_app, [blueprint], debug=DEBUG)
+            for blueprint in BLUEPRINTS
+        },
+        warm=FAST_STARTUP_WARM
+    )
+else:
+    app = create_app(BLUEPRINTS, debug=DEBUG)
+
+profile.record('app:boot', time.perf_counter() - _START)
 
 
 if __name__ == '__main__':
     # Create database directory if it doesn't exist
     db_dir = os.path.join(os.path.dirname(__file__), 'database')
     os.makedirs(db_dir, exist_ok=True)
-    
+
     # Get host and port from environment or use defaults
     host = os.environ.get('FLASK_HOST', '0.0.0.0')
     port = int(os.environ.get('FLASK_PORT', 5000))
-    debug = os.environ.get('FLASK_ENV', 'development') == 'development'
-    
-    logger.info(f"Starting Office Display Backend on {host}:{port}")
-    logger.info(f"Debug mode: {debug}")
-    
-    app.run(host=host, port=port, debug=debug)
+
+    logger.info("Starting Office Display Backend on %s:%s", host, port)
+    logger.info("Debug mode: %s", DEBUG)
+
+    if FAST_STARTUP:
+        logger.info("Fast startup mode: boot app ready in %.1f ms", (time.perf_counter() - _START) * 1000)
+        # The reloader would re-import everything in a child process, so it is disabled here
+        if DEBUG:
+            logger.warning("Fast startup mode: code reloader is disabled; restart to pick up changes")
+        app.run(host=host, port=port, debug=DEBUG, use_reloader=False)
+    else:
+        app.run(host=host, port=port, debug=DEBUG)
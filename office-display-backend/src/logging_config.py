@@ -0,0 +1,274 @@
+"""
+Logging configuration for Office Display application
+Provides a non-blocking, structured JSON logging pipeline with request ids and timings
+"""
+import atexit
+import copy
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+from flask import g, has_request_context, request
+
+# Attributes present on every LogRecord; anything else was passed via ``extra``.
+# ``sample`` is the SamplingFilter opt-in flag and is not emitted.
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'sample'}
+
+# Client-supplied X-Request-ID values must match this or a new id is generated
+_REQUEST_ID_PATTERN = re.compile(r'[A-Za-z0-9._-]{1,64}')
+
+_listener = None
+_queue_handler = None
+_stream_handler = None
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format log records as single-line JSON objects
+
+    Fields passed through ``extra`` (e.g. ``duration_ms``) are merged into
+    the top-level object so they can be queried by log aggregators.
+    """
+
+    def format(self, record):
+        """Serialize a log record to a JSON string"""
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = record.stack_info
+
+        return json.dumps(entry, default=str)
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread
+
+    The stock ``QueueHandler`` renders the full formatted line before
+    enqueueing; this only resolves the message arguments and traceback so
+    the record can be safely handed to another thread.
+    """
+
+    def prepare(self, record):
+        """Return a thread-safe copy of the record for the queue"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Attach the current request id to every record emitted inside a request
+
+    Runs on the request thread (before the record is queued) so the Flask
+    request context is still available.
+    """
+
+    def filter(self, record):
+        """Add ``request_id`` to the record when inside a request context"""
+        if has_request_context() and not hasattr(record, 'request_id'):
+            record.request_id = getattr(g, 'request_id', None)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only one in every ``rate`` records flagged with ``extra={'sample': True}``
+
+    Sampling is counted per message template and request path, so different
+    high-volume messages (and access lines for different paths) are sampled
+    independently. Records at WARNING and above, and records without the
+    flag, always pass through.
+    """
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = max(1, int(rate))
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        """Return True if the record should be emitted"""
+        if self.rate == 1 or record.levelno >= logging.WARNING:
+            return True
+        if not getattr(record, 'sample', False):
+            return True
+
+        with self._lock:
+            key = (record.msg, getattr(record, 'path', None))
+            counter = self._counters.setdefault(key, itertools.count())
+            seen = next(counter)
+
+        if seen % self.rate:
+            return False
+        record.sample_rate = self.rate
+        return True
+
+
+def configure_logging():
+    """
+    Configure the root logger with a queue-based, non-blocking pipeline
+
+    Request threads only enqueue records; a background ``QueueListener``
+    thread formats and writes them to stderr.
+
+    Threads do not survive ``fork()``, so pre-forking servers (uWSGI's default
+    mode, ``gunicorn --preload``) would leave workers writing to a queue that
+    nothing reads. A fork hook gives each child its own queue and listener.
+
+    Environment Variables:
+        LOG_LEVEL (str): Minimum log level (default: INFO)
+        LOG_FORMAT (str): ``json`` or ``text`` (default: json)
+        LOG_SAMPLE_RATE (int): Keep 1 in N sampled info records (default: 10)
+    """
+    global _queue_handler, _stream_handler
+
+    if _listener is not None:
+        return
+
+    # Invalid settings fall back to defaults so a typo in .env cannot stop
+    # the backend from booting; warnings are logged once the pipeline is up
+    config_warnings = []
+
+    level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    if not isinstance(logging.getLevelName(level), int):
+        config_warnings.append(f"Unknown LOG_LEVEL {level!r}, using INFO")
+        level = 'INFO'
+
+    log_format = os.environ.get('LOG_FORMAT', 'json').lower()
+
+    try:
+        sample_rate = int(os.environ.get('LOG_SAMPLE_RATE', 10))
+    except ValueError:
+        config_warnings.append(
+            f"Invalid LOG_SAMPLE_RATE {os.environ.get('LOG_SAMPLE_RATE')!r}, using 10"
+        )
+        sample_rate = 10
+
+    _stream_handler = logging.StreamHandler()
+    if log_format == 'text':
+        _stream_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+    else:
+        _stream_handler.setFormatter(JSONFormatter())
+
+    _queue_handler = StructuredQueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(RequestContextFilter())
+    _queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    root = logging.getLogger()
+    root.handlers[:] = [_queue_handler]
+    root.setLevel(level)
+
+    _start_listener(_queue_handler.queue)
+    atexit.register(_stop_listener)
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+    logger = logging.getLogger(__name__)
+    for message in config_warnings:
+        logger.warning(message)
+
+
+def _start_listener(log_queue):
+    """Start a listener thread writing records from ``log_queue`` to stderr"""
+    global _listener
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, _stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def _stop_listener():
+    """Flush remaining records and stop the current listener thread"""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _restart_listener_after_fork():
+    """
+    Give a forked child its own queue and listener thread
+
+    The parent's listener thread does not exist in the child, and records
+    already queued in the parent must not be written twice. Filter locks
+    held by another parent thread at fork time are replaced as well.
+    """
+    for log_filter in _queue_handler.filters:
+        if isinstance(log_filter, SamplingFilter):
+            log_filter._lock = threading.Lock()
+
+    _queue_handler.queue = queue.SimpleQueue()
+    _start_listener(_queue_handler.queue)
+
+
+def init_request_logging(app):
+    """
+    Register request hooks that assign request ids and log request timings
+
+    The request id is taken from the ``X-Request-ID`` header when it is a
+    short token of letters, digits, ``.``, ``_`` or ``-``; otherwise one is
+    generated. The id is echoed back on the response.
+
+    Args:
+        app (Flask): Application to register the hooks on
+    """
+    logger = logging.getLogger('office_display.access')
+
+    @app.before_request
+    def start_request_timer():
+        """Assign a request id and record the start time"""
+        request_id = request.headers.get('X-Request-ID', '')
+        if not _REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+        g.request_id = request_id
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def log_request(response):
+        """
+        Log method, path, status and duration of the completed request
+
+        Successful responses (health polls, static assets) are the highest
+        volume lines and are sampled; 4xx/5xx responses are always logged.
+        """
+        start = getattr(g, 'request_start', None)
+        duration_ms = round((time.perf_counter() - start) * 1000, 2) if start else None
+
+        logger.info(
+            '%s %s %s', request.method, request.path, response.status_code,
+            extra={
+                'sample': response.status_code < 400,
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'duration_ms': duration_ms,
+            }
+        )
+        response.headers['X-Request-ID'] = g.get('request_id', '')
+        return response
@@ -1,9 +1,24 @@
 """
 Routes package for Office Display application
 Contains all API endpoint blueprints
+
+Blueprints are imported lazily on attribute access so that loading one
+blueprint module does not pull in the dependencies of the others.
 """
-from .user import user_bp
-from .calendar import calendar_bp
-from .weather import weather_bp
+import importlib
+
+_BLUEPRINT_MODULES = {
+    'user_bp': '.user',
+    'calendar_bp': '.calendar',
+    'weather_bp': '.weather'
+}
 
 __all__ = ['user_bp', 'calendar_bp', 'weather_bp']
+
+
+def __getattr__(name):
+    """Import and return a blueprint on first access"""
+    if name in _BLUEPRINT_MODULES:
+        module = importlib.import_module(_BLUEPRINT_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
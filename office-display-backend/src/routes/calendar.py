@@ -56,7 +56,7 @@ def get_calendar_events():
             }
         ]
         
-        logger.info(f"Retrieved {len(sample_events)} calendar events")
+        logger.info("Retrieved %d calendar events", len(sample_events), extra={'sample': True})
         return jsonify({
             'events': sample_events,
             'status': 'success',
@@ -64,7 +64,7 @@ def get_calendar_events():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error retrieving calendar events: {str(e)}")
+        logger.error("Error retrieving calendar events: %s", e)
         return jsonify({
             'events': [],
             'status': 'error',
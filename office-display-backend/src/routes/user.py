@@ -23,10 +23,10 @@ def get_users():
     """
     try:
         users = User.query.all()
-        logger.info(f"Retrieved {len(users)} users")
+        logger.info("Retrieved %d users", len(users), extra={'sample': True})
         return jsonify([user.to_dict() for user in users]), 200
     except Exception as e:
-        logger.error(f"Error retrieving users: {str(e)}")
+        logger.error("Error retrieving users: %s", e)
         return jsonify({
             'status': 'error',
             'message': 'Failed to retrieve users'
@@ -63,7 +63,7 @@ def create_user():
         ).first()
         
         if existing_user:
-            logger.warning(f"Attempt to create duplicate user: {data['username']}")
+            logger.warning("Attempt to create duplicate user: %s", data['username'])
             return jsonify({
                 'status': 'error',
                 'message': 'User with this username or email already exists'
@@ -74,12 +74,12 @@ def create_user():
         db.session.add(user)
         db.session.commit()
         
-        logger.info(f"Created new user: {user.username}")
+        logger.info("Created new user: %s", user.username)
         return jsonify(user.to_dict()), 201
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error creating user: {str(e)}")
+        logger.error("Error creating user: %s", e)
         return jsonify({
             'status': 'error',
             'message': 'Failed to create user'
@@ -102,17 +102,17 @@ def get_user(user_id):
         user = User.query.get(user_id)
         
         if not user:
-            logger.warning(f"User not found: {user_id}")
+            logger.warning("User not found: %s", user_id)
             return jsonify({
                 'status': 'error',
                 'message': f'User with ID {user_id} not found'
             }), 404
         
-        logger.info(f"Retrieved user: {user.username}")
+        logger.info("Retrieved user: %s", user.username, extra={'sample': True})
         return jsonify(user.to_dict()), 200
         
     except Exception as e:
-        logger.error(f"Error retrieving user {user_id}: {str(e)}")
+        logger.error("Error retrieving user %s: %s", user_id, e)
         return jsonify({
             'status': 'error',
             'message': 'Failed to retrieve user'
@@ -139,7 +139,7 @@ def update_user(user_id):
         user = User.query.get(user_id)
         
         if not user:
-            logger.warning(f"User not found for update: {user_id}")
+            logger.warning("User not found for update: %s", user_id)
             return jsonify({
                 'status': 'error',
                 'message': f'User with ID {user_id} not found'
@@ -151,7 +151,7 @@ def update_user(user_id):
         if 'username' in data and data['username'] != user.username:
             existing = User.query.filter_by(username=data['username']).first()
             if existing:
-                logger.warning(f"Duplicate username in update: {data['username']}")
+                logger.warning("Duplicate username in update: %s", data['username'])
                 return jsonify({
                     'status': 'error',
                     'message': 'Username already exists'
@@ -162,7 +162,7 @@ def update_user(user_id):
         if 'email' in data and data['email'] != user.email:
             existing = User.query.filter_by(email=data['email']).first()
             if existing:
-                logger.warning(f"Duplicate email in update: {data['email']}")
+                logger.warning("Duplicate email in update: %s", data['email'])
                 return jsonify({
                     'status': 'error',
                     'message': 'Email already exists'
@@ -170,12 +170,12 @@ def update_user(user_id):
             user.email = data['email']
         
         db.session.commit()
-        logger.info(f"Updated user: {user.username}")
+        logger.info("Updated user: %s", user.username)
         return jsonify(user.to_dict()), 200
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error updating user {user_id}: {str(e)}")
+        logger.error("Error updating user %s: %s", user_id, e)
         return jsonify({
             'status': 'error',
             'message': 'Failed to update user'
@@ -198,7 +198,7 @@ def delete_user(user_id):
         user = User.query.get(user_id)
         
         if not user:
-            logger.warning(f"User not found for deletion: {user_id}")
+            logger.warning("User not found for deletion: %s", user_id)
             return jsonify({
                 'status': 'error',
                 'message': f'User with ID {user_id} not found'
@@ -206,12 +206,12 @@ def delete_user(user_id):
         
         db.session.delete(user)
         db.session.commit()
-        logger.info(f"Deleted user: {user.username}")
+        logger.info("Deleted user: %s", user.username)
         return '', 204
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting user {user_id}: {str(e)}")
+        logger.error("Error deleting user %s: %s", user_id, e)
         return jsonify({
             'status': 'error',
             'message': 'Failed to delete user'
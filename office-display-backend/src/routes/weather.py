@@ -37,6 +37,75 @@ WEATHER_DESCRIPTIONS = {
     99: 'Thunderstorm with heavy hail'
 }
 
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+CURRENT_FIELDS = 'temperature_2m,relative_humidity_2m,weather_code'
+
+# Coordinates are rounded to this many decimal places (~1.1 km) when
+# deduplicating batch locations; displays in the same grid cell share a fetch
+GRID_PRECISION = 2
+
+# Upper bound on locations per batch request to keep the upstream URL short
+MAX_BATCH_LOCATIONS = 100
+
+
+def _build_weather_data(current, lat, lon):
+    """
+    Convert an Open-Meteo ``current`` block into the display weather format
+
+    Args:
+        current (dict): ``current`` object from the Open-Meteo response
+        lat (float): Requested latitude
+        lon (float): Requested longitude
+
+    Returns:
+        dict: Weather data with temperature, humidity and description
+    """
+    weather_code = current.get('weather_code', 0)
+    return {
+        'temperature': round(current.get('temperature_2m', 0)),
+        'humidity': round(current.get('relative_humidity_2m', 0)),
+        'description': WEATHER_DESCRIPTIONS.get(weather_code, 'Unknown'),
+        'weather_code': weather_code,
+        'location': f'Lat: {lat}, Lon: {lon}',
+        'last_updated': current.get('time', datetime.now().isoformat())
+    }
+
+
+def _upstream_error_response(error, context):
+    """
+    Log an error raised while fetching weather and build the error response
+    
+    Shared by all weather endpoints so their error messages stay consistent.
+    
+    Args:
+        error (Exception): Exception raised while handling the request
+        context (str): Endpoint description used in log messages
+    
+    Returns:
+        tuple: JSON error response and 500 status code
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        logger.error("Weather API request timeout (%s)", context)
+        message = 'Weather service request timed out. Please try again.'
+    elif isinstance(error, requests.exceptions.ConnectionError):
+        logger.error("Weather API connection error (%s)", context)
+        message = 'Failed to connect to weather service. Please check your internet connection.'
+    elif isinstance(error, requests.exceptions.HTTPError):
+        logger.error("Weather API HTTP error (%s): %s", context, error)
+        message = f'Weather service returned an error: {str(error)}'
+    elif isinstance(error, requests.exceptions.RequestException):
+        logger.error("Weather API request error (%s): %s", context, error)
+        message = f'Failed to fetch weather data: {str(error)}'
+    else:
+        logger.error("Unexpected error in %s endpoint: %s", context, error)
+        message = f'Unexpected error: {str(error)}'
+    
+    return jsonify({
+        'weather': None,
+        'status': 'error',
+        'message': message
+    }), 500
+
 
 @weather_bp.route('/weather/current', methods=['GET'])
 def get_current_weather():
@@ -74,7 +143,7 @@ def get_current_weather():
             lat = float(request.args.get('lat', default_latitude))
             lon = float(request.args.get('lon', default_longitude))
         except ValueError:
-            logger.warning(f"Invalid coordinates provided: lat={request.args.get('lat')}, lon={request.args.get('lon')}")
+            logger.warning("Invalid coordinates provided: lat=%s, lon=%s", request.args.get('lat'), request.args.get('lon'))
             return jsonify({
                 'weather': None,
                 'status': 'error',
@@ -83,88 +152,161 @@ def get_current_weather():
         
         # Validate coordinate ranges
         if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-            logger.warning(f"Coordinates out of range: lat={lat}, lon={lon}")
+            logger.warning("Coordinates out of range: lat=%s, lon=%s", lat, lon)
             return jsonify({
                 'weather': None,
                 'status': 'error',
                 'message': 'Invalid coordinates. Latitude must be -90 to 90, longitude must be -180 to 180.'
             }), 400
         
-        # Open-Meteo API endpoint for current weather
-        url = "https://api.open-meteo.com/v1/forecast"
         params = {
             'latitude': lat,
             'longitude': lon,
-            'current': 'temperature_2m,relative_humidity_2m,weather_code',
+            'current': CURRENT_FIELDS,
             'timezone': 'auto'
         }
         
-        logger.info(f"Fetching weather data for coordinates: lat={lat}, lon={lon}")
+        logger.info("Fetching weather data for coordinates: lat=%s, lon=%s", lat, lon, extra={'sample': True})
         
         # Make API request with timeout
-        response = requests.get(url, params=params, timeout=10)
+        response = requests.get(OPEN_METEO_URL, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
-        current = data.get('current', {})
-        
-        # Extract weather code and get description
-        weather_code = current.get('weather_code', 0)
-        description = WEATHER_DESCRIPTIONS.get(weather_code, 'Unknown')
-        
-        # Build response
-        weather_data = {
-            'temperature': round(current.get('temperature_2m', 0)),
-            'humidity': round(current.get('relative_humidity_2m', 0)),
-            'description': description,
-            'weather_code': weather_code,
-            'location': f'Lat: {lat}, Lon: {lon}',
-            'last_updated': current.get('time', datetime.now().isoformat())
-        }
+        weather_data = _build_weather_data(data.get('current', {}), lat, lon)
         
-        logger.info(f"Successfully retrieved weather: {description}, {weather_data['temperature']}°C")
+        logger.info(
+            "Successfully retrieved weather: %s, %s°C",
+            weather_data['description'], weather_data['temperature'],
+            extra={'sample': True}
+        )
         
         return jsonify({
             'weather': weather_data,
             'status': 'success'
         }), 200
         
-    except requests.exceptions.Timeout:
-        logger.error("Weather API request timeout")
-        return jsonify({
-            'weather': None,
-            'status': 'error',
-            'message': 'Weather service request timed out. Please try again.'
-        }), 500
+    except Exception as e:
+        return _upstream_error_response(e, 'current weather')
+
+
+@weather_bp.route('/weather/batch', methods=['POST'])
+def get_batch_weather():
+    """
+    Get current weather for multiple locations with a single Open-Meteo request
     
-    except requests.exceptions.ConnectionError:
-        logger.error("Weather API connection error")
-        return jsonify({
-            'weather': None,
-            'status': 'error',
-            'message': 'Failed to connect to weather service. Please check your internet connection.'
-        }), 500
+    Locations are deduplicated by grid cell (coordinates rounded to
+    GRID_PRECISION decimal places) and fetched together using Open-Meteo's
+    comma-separated multi-coordinate form, then fanned back out in request order.
     
-    except requests.exceptions.HTTPError as e:
-        logger.error(f"Weather API HTTP error: {str(e)}")
-        return jsonify({
-            'weather': None,
-            'status': 'error',
-            'message': f'Weather service returned an error: {str(e)}'
-        }), 500
+    Request JSON:
+        locations (list): Objects with ``lat``, ``lon`` and an optional ``id``
     
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Weather API request error: {str(e)}")
-        return jsonify({
-            'weather': None,
-            'status': 'error',
-            'message': f'Failed to fetch weather data: {str(e)}'
-        }), 500
+    Returns:
+        JSON: Weather data for each requested location, in request order
+        Status: 200 on success, 400 on invalid parameters, 500 on API error
     
-    except Exception as e:
-        logger.error(f"Unexpected error in weather endpoint: {str(e)}")
+    Example Response:
+        {
+            "weather": [
+                {
+                    "id": "building-a",
+                    "temperature": 72,
+                    "humidity": 65,
+                    "description": "Partly cloudy",
+                    "weather_code": 2,
+                    "location": "Lat: 37.7749, Lon: -122.4194",
+                    "last_updated": "2025-01-15T10:30:00"
+                }
+            ],
+            "status": "success"
+        }
+    """
+    try:
+        data = request.get_json(silent=True)
+        locations = data.get('locations') if isinstance(data, dict) else None
+        
+        if not isinstance(locations, list) or not locations:
+            logger.warning("Batch weather request missing locations")
+            return jsonify({
+                'weather': None,
+                'status': 'error',
+                'message': 'Missing required field: locations (non-empty list)'
+            }), 400
+        
+        if len(locations) > MAX_BATCH_LOCATIONS:
+            logger.warning("Batch weather request too large: %d locations", len(locations))
+            return jsonify({
+                'weather': None,
+                'status': 'error',
+                'message': f'Too many locations. Maximum is {MAX_BATCH_LOCATIONS}.'
+            }), 400
+        
+        # Validate coordinates and group locations by grid cell
+        requested = []
+        cells = {}
+        for index, location in enumerate(locations):
+            try:
+                if isinstance(location['lat'], bool) or isinstance(location['lon'], bool):
+                    raise TypeError('Boolean coordinates are not allowed')
+                lat = float(location['lat'])
+                lon = float(location['lon'])
+            except (TypeError, KeyError, ValueError):
+                logger.warning("Invalid coordinates in batch at index %d: %s", index, location)
+                return jsonify({
+                    'weather': None,
+                    'status': 'error',
+                    'message': f'Invalid latitude or longitude at index {index}. Must be numeric values.'
+                }), 400
+            
+            if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+                logger.warning("Coordinates out of range in batch at index %d: lat=%s, lon=%s", index, lat, lon)
+                return jsonify({
+                    'weather': None,
+                    'status': 'error',
+                    'message': f'Invalid coordinates at index {index}. Latitude must be -90 to 90, longitude must be -180 to 180.'
+                }), 400
+            
+            cell = (round(lat, GRID_PRECISION), round(lon, GRID_PRECISION))
+            cells.setdefault(cell, len(cells))
+            requested.append((location.get('id', index), lat, lon, cell))
+        
+        unique_cells = list(cells)
+        params = {
+            'latitude': ','.join(str(cell_lat) for cell_lat, _ in unique_cells),
+            'longitude': ','.join(str(cell_lon) for _, cell_lon in unique_cells),
+            'current': CURRENT_FIELDS,
+            'timezone': 'auto'
+        }
+        
+        logger.info(
+            "Fetching batch weather for %d locations in %d grid cells",
+            len(requested), len(unique_cells)
+        )
+        
+        response = requests.get(OPEN_METEO_URL, params=params, timeout=10)
+        response.raise_for_status()
+        
+        # Open-Meteo returns a list for multiple coordinates, an object for one
+        results = response.json()
+        if isinstance(results, dict):
+            results = [results]
+        
+        if len(results) != len(unique_cells):
+            raise ValueError(
+                f'Expected {len(unique_cells)} results from weather service, got {len(results)}'
+            )
+        
+        # Fan results back out to every requested location
+        weather_list = []
+        for location_id, lat, lon, cell in requested:
+            current = results[cells[cell]].get('current', {})
+            weather_list.append({'id': location_id, **_build_weather_data(current, lat, lon)})
+        
         return jsonify({
-            'weather': None,
-            'status': 'error',
-            'message': f'Unexpected error: {str(e)}'
-        }), 500
+            'weather': weather_list,
+            'status': 'success'
+        }), 200
+        
+    except Exception as e:
+        return _upstream_error_response(e, 'batch weather')
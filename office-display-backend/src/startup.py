@@ -0,0 +1,186 @@
+"""
+Startup helpers for Office Display application
+Supports a fast cold-start mode that defers blueprint imports until first use
+"""
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+
+from werkzeug.wsgi import ClosingIterator
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """
+    Record how long each startup phase and deferred module import took
+
+    Only first-time imports are recorded; modules already in ``sys.modules``
+    cost nothing and are skipped. For a full breakdown of every transitive
+    import, run the backend with ``python -X importtime main.py``.
+    """
+
+    def __init__(self):
+        self._timings = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        """
+        Record the duration of a startup phase
+
+        Args:
+            name (str): Phase or module name
+            seconds (float): Elapsed time in seconds
+        """
+        with self._lock:
+            self._timings[name] = seconds
+
+    def import_module(self, module_name):
+        """
+        Import a module, recording the import time if it was not yet loaded
+
+        Args:
+            module_name (str): Absolute module name
+
+        Returns:
+            module: The imported module
+        """
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self.record(f'import:{module_name}', time.perf_counter() - start)
+        return module
+
+    def report(self):
+        """
+        Build the startup profile report
+
+        Returns:
+            dict: Recorded timings, slowest first
+        """
+        with self._lock:
+            timings = sorted(self._timings.items(), key=lambda item: item[1], reverse=True)
+
+        return {
+            'timings': [
+                {'name': name, 'ms': round(seconds * 1000, 1)}
+                for name, seconds in timings
+            ]
+        }
+
+
+profile = StartupProfile()
+
+
+class LazyBlueprintDispatcher:
+    """
+    WSGI middleware that builds blueprint apps on first use
+
+    Requests under a registered URL prefix are dispatched to an app built by
+    that prefix's factory the first time it is needed; everything else is
+    served by the lightweight boot app (health check and static files).
+    Install it as ``app.wsgi_app`` so the boot app stays a regular Flask
+    instance for the Flask CLI.
+
+    With ``warm`` enabled, the remaining apps are built on a background
+    thread once the first request in each process has been served. Nothing
+    is started at import, so pre-forking servers (uWSGI, ``gunicorn
+    --preload``) never fork while a warm-up thread holds a lock.
+
+    Args:
+        boot_app (callable): WSGI app used for paths without a lazy prefix
+        factories (dict): URL prefix -> callable returning a WSGI app
+        warm (bool): Build all apps in the background after the first request
+    """
+
+    def __init__(self, boot_app, factories, warm=False):
+        self.boot_app = boot_app
+        self.factories = factories
+        self.warm = warm
+        self.apps = {}
+        self._warm_pid = None
+        self._reset_locks()
+        os.register_at_fork(after_in_child=self._reset_locks)
+
+    def _reset_locks(self):
+        """Create fresh locks; locks held by another thread do not survive fork"""
+        self._locks = {prefix: threading.Lock() for prefix in self.factories}
+        self._warm_lock = threading.Lock()
+
+    def get_app(self, prefix):
+        """
+        Return the app for a URL prefix, building it on first use
+
+        Args:
+            prefix (str): Registered URL prefix
+
+        Returns:
+            callable: WSGI app serving the prefix
+        """
+        app = self.apps.get(prefix)
+        if app is not None:
+            return app
+
+        with self._locks[prefix]:
+            app = self.apps.get(prefix)
+            if app is None:
+                start = time.perf_counter()
+                app = self.factories[prefix]()
+                elapsed = time.perf_counter() - start
+                profile.record(f'app:{prefix}', elapsed)
+                logger.info("Warmed %s in %.1f ms", prefix, elapsed * 1000)
+                self.apps[prefix] = app
+        return app
+
+    def _warm_once(self):
+        """Start the background warm-up once per process"""
+        with self._warm_lock:
+            if self._warm_pid == os.getpid():
+                return
+            self._warm_pid = os.getpid()
+        self.warm_in_background()
+
+    def warm_in_background(self):
+        """
+        Build all blueprint apps on a background thread
+
+        Requests that arrive for a prefix still being built wait for it;
+        the boot app keeps serving in the meantime.
+
+        Returns:
+            threading.Thread: The started warm-up thread
+        """
+        def warm():
+            for prefix in self.factories:
+                try:
+                    self.get_app(prefix)
+                except Exception:
+                    logger.exception("Failed to warm %s", prefix)
+            logger.info("Startup profile: %s", profile.report())
+
+        thread = threading.Thread(target=warm, name='app-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    def __call__(self, environ, start_response):
+        """Dispatch a WSGI request to the matching app"""
+        path = environ.get('PATH_INFO', '')
+        app = self.boot_app
+        for prefix in self.factories:
+            if path == prefix or path.startswith(prefix + '/'):
+                app = self.get_app(prefix)
+                break
+
+        response = app(environ, start_response)
+
+        # Warm up only after the response is finished so it does not compete
+        # with the first request
+        if self.warm and self._warm_pid != os.getpid():
+            return ClosingIterator(response, self._warm_once)
+        return response
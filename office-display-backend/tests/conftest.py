@@ -0,0 +1,8 @@
+"""
+Shared pytest configuration for Office Display backend tests
+"""
+import os
+import sys
+
+# Make the backend package importable when running pytest from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
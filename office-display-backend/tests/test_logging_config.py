@@ -0,0 +1,90 @@
+"""
+Tests for the structured logging pipeline
+"""
+import json
+import logging
+import sys
+
+from flask import Flask
+
+from src.logging_config import JSONFormatter, SamplingFilter, init_request_logging
+
+
+def make_record(msg='Retrieved %d users', level=logging.INFO, **extra):
+    """Build a log record with optional ``extra`` attributes"""
+    record = logging.makeLogRecord({'msg': msg, 'args': (3,), 'levelno': level,
+                                    'levelname': logging.getLevelName(level)})
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_sampling_filter_keeps_one_in_rate():
+    """Flagged info records are kept once per ``rate`` records"""
+    sampling = SamplingFilter(3)
+    kept = [sampling.filter(make_record(sample=True)) for _ in range(7)]
+    assert kept == [True, False, False, True, False, False, True]
+
+
+def test_sampling_filter_passes_unflagged_and_warnings():
+    """Unflagged records and warnings are never sampled out"""
+    sampling = SamplingFilter(10)
+    assert all(sampling.filter(make_record()) for _ in range(5))
+    assert all(sampling.filter(make_record(level=logging.WARNING, sample=True)) for _ in range(5))
+
+
+def test_sampling_filter_counts_paths_independently():
+    """A busy path does not cause a rare path's access line to be dropped"""
+    sampling = SamplingFilter(10)
+    for _ in range(5):
+        sampling.filter(make_record('%s %s %s', sample=True, path='/api/health'))
+    assert sampling.filter(make_record('%s %s %s', sample=True, path='/api/users'))
+
+
+def test_json_formatter_includes_extras_exception_and_stack():
+    """Extra fields, tracebacks and stack info are written to the JSON entry"""
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        record = logging.makeLogRecord({
+            'name': 'test', 'msg': 'failed %s', 'args': ('x',),
+            'levelno': logging.ERROR, 'levelname': 'ERROR',
+            'exc_info': sys.exc_info(),
+            'stack_info': 'Stack (most recent call last):',
+            'duration_ms': 1.5, 'sample': True,
+        })
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry['message'] == 'failed x'
+    assert entry['duration_ms'] == 1.5
+    assert 'sample' not in entry
+    assert 'ValueError: boom' in entry['exception']
+    assert entry['stack'] == 'Stack (most recent call last):'
+
+
+def make_app():
+    """Create a minimal app with request logging hooks"""
+    app = Flask(__name__)
+    init_request_logging(app)
+
+    @app.route('/ping')
+    def ping():
+        return 'pong'
+
+    return app
+
+
+def test_request_id_is_echoed():
+    """A well-formed client request id is echoed on the response"""
+    response = make_app().test_client().get('/ping', headers={'X-Request-ID': 'kiosk-7.abc_1'})
+    assert response.headers['X-Request-ID'] == 'kiosk-7.abc_1'
+
+
+def test_request_id_is_generated_when_missing_or_invalid():
+    """Missing, oversized or unsafe request ids are replaced with a new id"""
+    client = make_app().test_client()
+    for headers in ({}, {'X-Request-ID': 'a' * 65}, {'X-Request-ID': 'bad id"}'}):
+        request_id = client.get('/ping', headers=headers).headers['X-Request-ID']
+        assert len(request_id) == 32
+        assert request_id != headers.get('X-Request-ID')
@@ -0,0 +1,97 @@
+"""
+Tests for fast cold-start mode helpers
+"""
+import os
+import time
+
+import pytest
+from flask import Flask
+
+import main
+from src.startup import LazyBlueprintDispatcher
+
+
+def make_named_app(name):
+    """Create an app that answers every path with its own name"""
+    app = Flask(name)
+
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def whoami(path):
+        return name
+
+    return app
+
+
+@pytest.fixture
+def dispatcher():
+    """Boot app dispatching to a lazily built users app, and the build log"""
+    built = []
+
+    def build_users():
+        built.append('users')
+        return make_named_app('users')
+
+    boot = make_named_app('boot')
+    boot.wsgi_app = LazyBlueprintDispatcher(boot.wsgi_app, {'/api/users': build_users})
+    return boot, built
+
+
+def test_dispatcher_routes_by_prefix(dispatcher):
+    """Only the prefix itself and paths below it reach the lazy app"""
+    boot, built = dispatcher
+    client = boot.test_client()
+
+    assert client.get('/api/health').data == b'boot'
+    assert client.get('/api/usersx').data == b'boot'
+    assert built == []
+
+    assert client.get('/api/users').data == b'users'
+    assert client.get('/api/users/1').data == b'users'
+    assert built == ['users']
+
+
+def test_dispatcher_warms_after_first_request():
+    """Warm-up starts only once the first response has been closed"""
+    boot = make_named_app('boot')
+    boot.wsgi_app = LazyBlueprintDispatcher(
+        boot.wsgi_app, {'/api/users': lambda: make_named_app('users')}, warm=True
+    )
+    dispatcher = boot.wsgi_app
+
+    response = boot.test_client().get('/api/health')
+    assert dispatcher.apps == {}
+
+    response.close()
+    deadline = time.monotonic() + 5
+    while '/api/users' not in dispatcher.apps and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert '/api/users' in dispatcher.apps
+    assert dispatcher._warm_pid == os.getpid()
+
+
+def test_dispatcher_resets_locks_after_fork(dispatcher):
+    """A lock held when the process forks does not block the child"""
+    boot, _ = dispatcher
+    boot.wsgi_app._locks['/api/users'].acquire()
+    boot.wsgi_app._reset_locks()
+
+    assert boot.test_client().get('/api/users').data == b'users'
+
+
+def test_cached_index_reloads_when_file_changes(tmp_path):
+    """A new frontend build is served without restarting"""
+    index_path = tmp_path / 'index.html'
+    index_path.write_text('build 1')
+
+    app = main.create_app([], cache_index=True)
+    app.static_folder = str(tmp_path)
+    client = app.test_client()
+
+    assert client.get('/').data == b'build 1'
+
+    index_path.write_text('build 2')
+    mtime_ns = os.stat(index_path).st_mtime_ns + 1_000_000_000
+    os.utime(index_path, ns=(mtime_ns, mtime_ns))
+
+    assert client.get('/kiosk').data == b'build 2'
@@ -0,0 +1,110 @@
+"""
+Tests for the weather API routes
+"""
+from unittest import mock
+
+import pytest
+from flask import Flask
+
+from src.routes.weather import MAX_BATCH_LOCATIONS, weather_bp
+
+
+def current_block(temperature, weather_code=2):
+    """Build one Open-Meteo result object"""
+    return {
+        'current': {
+            'temperature_2m': temperature,
+            'relative_humidity_2m': 50,
+            'weather_code': weather_code,
+            'time': '2025-01-15T10:30'
+        }
+    }
+
+
+@pytest.fixture
+def client():
+    """Test client for an app serving only the weather blueprint"""
+    app = Flask(__name__)
+    app.register_blueprint(weather_bp, url_prefix='/api')
+    return app.test_client()
+
+
+@pytest.fixture
+def upstream():
+    """Mock ``requests.get`` used for Open-Meteo calls"""
+    with mock.patch('src.routes.weather.requests.get') as get:
+        yield get
+
+
+def test_batch_dedupes_grid_cells_in_one_upstream_call(client, upstream):
+    """Locations in the same grid cell share one coordinate in a single request"""
+    upstream.return_value.json.return_value = [current_block(10), current_block(20)]
+
+    response = client.post('/api/weather/batch', json={'locations': [
+        {'id': 'a', 'lat': 37.7749, 'lon': -122.4194},
+        {'id': 'b', 'lat': 40.7128, 'lon': -74.006},
+        {'id': 'c', 'lat': 37.7741, 'lon': -122.4191},
+    ]})
+
+    assert response.status_code == 200
+    upstream.assert_called_once()
+    params = upstream.call_args.kwargs['params']
+    assert params['latitude'] == '37.77,40.71'
+    assert params['longitude'] == '-122.42,-74.01'
+
+    weather = response.get_json()['weather']
+    assert [item['id'] for item in weather] == ['a', 'b', 'c']
+    assert [item['temperature'] for item in weather] == [10, 20, 10]
+    assert weather[2]['location'] == 'Lat: 37.7741, Lon: -122.4191'
+
+
+def test_batch_single_location_accepts_object_response(client, upstream):
+    """Open-Meteo returns an object rather than a list for one coordinate"""
+    upstream.return_value.json.return_value = current_block(15, weather_code=0)
+
+    response = client.post('/api/weather/batch', json={'locations': [{'lat': 1, 'lon': 2}]})
+
+    assert response.status_code == 200
+    weather = response.get_json()['weather']
+    assert weather == [{
+        'id': 0,
+        'temperature': 15,
+        'humidity': 50,
+        'description': 'Clear sky',
+        'weather_code': 0,
+        'location': 'Lat: 1.0, Lon: 2.0',
+        'last_updated': '2025-01-15T10:30'
+    }]
+
+
+@pytest.mark.parametrize('body', [
+    [1, 2],
+    'locations',
+    {},
+    {'locations': []},
+    {'locations': [{'lat': True, 'lon': 1}]},
+    {'locations': [{'lat': float('nan'), 'lon': 1}]},
+    {'locations': [{'lon': 1}]},
+    {'locations': [{'lat': 91, 'lon': 1}]},
+    {'locations': [{'lat': 1, 'lon': 1}] * (MAX_BATCH_LOCATIONS + 1)},
+])
+def test_batch_rejects_invalid_requests(client, upstream, body):
+    """Malformed bodies and coordinates are client errors"""
+    response = client.post('/api/weather/batch', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['status'] == 'error'
+    upstream.assert_not_called()
+
+
+def test_batch_result_count_mismatch_is_server_error(client, upstream):
+    """A short upstream response is reported instead of mis-mapping results"""
+    upstream.return_value.json.return_value = [current_block(10)]
+
+    response = client.post('/api/weather/batch', json={'locations': [
+        {'lat': 10, 'lon': 10},
+        {'lat': 20, 'lon': 20},
+    ]})
+
+    assert response.status_code == 500
+    assert 'Expected 2 results' in response.get_json()['message']